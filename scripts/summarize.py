@@ -12,39 +12,78 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
+import hashlib
+import io
 import json
+import operator
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
 import textwrap
-import uuid
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Sequence
+from typing import Any, Iterator, List, Sequence
 
 try:
     from zoneinfo import ZoneInfo
 except ImportError as exc:  # pragma: no cover
     raise SystemExit("Python 3.9+ with zoneinfo support is required.") from exc
 
+try:
+    NY_TZ = ZoneInfo("America/New_York")
+    UTC_TZ = ZoneInfo("UTC")
+except Exception as exc:  # pragma: no cover
+    raise SystemExit("summarize: Unable to load America/New_York timezone.") from exc
+
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 TMP_ROOT = Path("/tmp/caseproof-summarize")
+# Cached search results are read back and trusted, so keep them in a per-user
+# location (XDG_CACHE_HOME or ~/.cache) rather than the shared /tmp.
+_XDG_CACHE_HOME = os.environ.get("XDG_CACHE_HOME", "")
+CACHE_ROOT = (
+    Path(_XDG_CACHE_HOME) if os.path.isabs(_XDG_CACHE_HOME) else Path.home() / ".cache"
+) / "caseproof-summarize"
 TASKS_DIR = REPO_ROOT / "my-tasks"
 CONFIG_PATH = REPO_ROOT / "config/status.json"
 TODOS_TITLE_PREFIX = "Todos for "
 LEGACY_TODOS_PREFIXES = ("Caseproof Todos for ",)
 ALL_TODO_PREFIXES = (TODOS_TITLE_PREFIX, *LEGACY_TODOS_PREFIXES)
-OWNER_PLACEHOLDER = "__OWNER_PLACEHOLDER__"
+SEARCH_LIMIT = 50
+SEARCH_CACHE_TTL_SECONDS = 3600
+ALREADY_EXISTS_MESSAGE = textwrap.dedent(
+    """
+    Today's checklist already exists (found local Markdown file for the current America/New_York day).
+    Showing the current file instead of regenerating.
+    """
+).strip()
+SEARCH_NODE_FIELDS = (
+    "... on Issue { number title url repository { nameWithOwner } } "
+    "... on PullRequest { number title url isDraft repository { nameWithOwner } }"
+)
 
 
 class SummarizeError(RuntimeError):
     """Raised when the summarize workflow cannot continue."""
 
 
-def run(cmd: Sequence[str], *, cwd: Path = REPO_ROOT) -> subprocess.CompletedProcess:
-    """Run a command and ensure it succeeds."""
+def run(
+    cmd: Sequence[str],
+    *,
+    cwd: Path = REPO_ROOT,
+    text: bool = True,
+    label: str | None = None,
+) -> subprocess.CompletedProcess:
+    """Run a command and ensure it succeeds.
+
+    Pass ``text=False`` to receive stdout as raw bytes, and ``label`` to name the
+    command in failure messages instead of echoing its full argument list.
+    """
     try:
         result = subprocess.run(
             cmd,
@@ -52,24 +91,56 @@ def run(cmd: Sequence[str], *, cwd: Path = REPO_ROOT) -> subprocess.CompletedPro
             check=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            text=text,
         )
     except FileNotFoundError as exc:
         missing = cmd[0]
         raise SummarizeError(f"Required command `{missing}` is not installed.") from exc
     except subprocess.CalledProcessError as exc:
+        stderr = exc.stderr if text else exc.stderr.decode("utf-8", errors="replace")
         raise SummarizeError(
-            f"Command `{' '.join(cmd)}` failed with exit code {exc.returncode}:\n"
-            f"{exc.stderr.strip()}"
+            f"Command `{label or ' '.join(cmd)}` failed with exit code {exc.returncode}:\n"
+            f"{stderr.strip()}"
         ) from exc
     return result
 
 
+def write_artifact(prefix: str, data: bytes) -> Path:
+    """Save a failed response for inspection and return its path.
+
+    ``mkstemp`` creates a fresh 0600 file with O_EXCL, so a predictable name or a
+    planted symlink under the shared /tmp can never redirect the write.
+    """
+    fd, name = tempfile.mkstemp(dir=ensure_tmp_dir(), prefix=f"{prefix}-", suffix=".json")
+    with os.fdopen(fd, "wb") as artifact_file:
+        artifact_file.write(data)
+    return Path(name)
+
+
+def run_json(
+    cmd: Sequence[str], *, artifact_prefix: str, label: str | None = None
+) -> Any:
+    """Run a command and parse its stdout as JSON.
+
+    The raw output is only written to an artifact file when it fails to parse,
+    so successful runs leave nothing behind on disk.
+    """
+    # json.loads accepts UTF-8 bytes, so skip decoding stdout to str first.
+    result = run(cmd, text=False, label=label)
+    try:
+        return json.loads(result.stdout)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        artifact_path = write_artifact(artifact_prefix, result.stdout)
+        raise SummarizeError(
+            f"Failed to parse JSON output of `{label or cmd[0]}`. See {artifact_path}."
+        ) from exc
+
+
 @dataclasses.dataclass(frozen=True)
 class Query:
     slug: str
     heading: str
-    command: Sequence[str]
+    search_terms: str
     imperative_template: str
     empty_message: str
 
@@ -84,13 +155,16 @@ class Query:
         title = " ".join(title.split())
         repository = repo_slug_from_item(item)
         link = f"[{repository}#{number} {title}]({url})"
-        canonical = canonicalize_reference(url, repository, number)
+        canonical = item.get("_canonical_url") or canonicalize_reference(
+            url, repository, number
+        )
         return canonical, self.imperative_template.format(link=link)
 
     def format_item(self, item: dict[str, Any]) -> str:
         return self.format_entry(item)[1]
 
 
+@functools.lru_cache(maxsize=1)
 def load_configuration() -> tuple[tuple[str, ...], str | None]:
     if not CONFIG_PATH.exists():
         raise SummarizeError(
@@ -154,63 +228,21 @@ def build_queries() -> List[Query]:
         Query(
             slug="assigned-issues",
             heading="Assigned Issues",
-            command=[
-                "gh",
-                "search",
-                "issues",
-                "--owner",
-                OWNER_PLACEHOLDER,
-                "--assignee",
-                "@me",
-                "--state",
-                "open",
-                "--json",
-                "number,title,url,repository",
-                "--limit",
-                "50",
-            ],
+            search_terms="is:issue is:open assignee:@me",
             imperative_template="Triage {link}.",
             empty_message="Confirm no assigned issues need attention.",
         ),
         Query(
             slug="review-requests",
             heading="PR Review Requests",
-            command=[
-                "gh",
-                "search",
-                "prs",
-                "--owner",
-                OWNER_PLACEHOLDER,
-                "--review-requested",
-                "@me",
-                "--state",
-                "open",
-                "--json",
-                "number,title,url,repository,isDraft",
-                "--limit",
-                "50",
-            ],
+            search_terms="is:pr is:open review-requested:@me",
             imperative_template="Review {link}.",
             empty_message="Confirm no outstanding review requests.",
         ),
         Query(
             slug="authored-prs",
             heading="Authored PRs",
-            command=[
-                "gh",
-                "search",
-                "prs",
-                "--owner",
-                OWNER_PLACEHOLDER,
-                "--author",
-                "@me",
-                "--state",
-                "open",
-                "--json",
-                "number,title,url,repository,isDraft",
-                "--limit",
-                "50",
-            ],
+            search_terms="is:pr is:open author:@me",
             imperative_template="Follow up on {link}.",
             empty_message="Confirm no authored PRs require action.",
         ),
@@ -222,65 +254,183 @@ def ensure_tmp_dir() -> Path:
     return TMP_ROOT
 
 
-def build_command_for_org(base_command: Sequence[str], org: str) -> List[str]:
-    cmd = list(base_command)
-    replaced = False
-    for index, token in enumerate(cmd):
-        if token == OWNER_PLACEHOLDER:
-            cmd[index] = org
-            replaced = True
-            break
-    if not replaced:
-        cmd.extend(["--owner", org])
-    return cmd
+def build_search_document(
+    queries: Sequence[Query],
+) -> tuple[str, dict[str, str], dict[str, tuple[Query, str]]]:
+    """Build one GraphQL document holding a search per (query, org) pair.
+
+    Each search is aliased so the whole workload costs a single `gh` round-trip
+    while still honouring the per-organization result limit.
+    """
+    variables: dict[str, str] = {}
+    aliases: dict[str, tuple[Query, str]] = {}
+    fields: list[str] = []
+    for query_index, query in enumerate(queries):
+        for org_index, org in enumerate(ORG_NAMES):
+            alias = f"q{query_index}_{org_index}"
+            variables[alias] = f"{query.search_terms} user:{org}"
+            aliases[alias] = (query, org)
+            fields.append(
+                f"{alias}: search(query: ${alias}, type: ISSUE, first: {SEARCH_LIMIT}) "
+                f"{{ nodes {{ {SEARCH_NODE_FIELDS} }} }}"
+            )
+    declarations = ", ".join(f"${alias}: String!" for alias in variables)
+    document = f"query({declarations}) {{ {' '.join(fields)} }}"
+    return document, variables, aliases
 
 
 def is_automation_issue(item: dict[str, Any]) -> bool:
-    title = (item.get("title") or "").strip()
-    return any(title.startswith(prefix) for prefix in ALL_TODO_PREFIXES)
-
-
-def run_query(query: Query) -> dict[str, list[dict[str, Any]]]:
-    tmp_dir = ensure_tmp_dir()
-    aggregated: dict[str, list[dict[str, Any]]] = {org: [] for org in ORG_NAMES}
-    seen_urls: set[str] = set()
-    for org in ORG_NAMES:
-        artifact_path = tmp_dir / f"{query.slug}-{org}-{uuid.uuid4().hex}.json"
-        cmd = build_command_for_org(query.command, org)
-        with artifact_path.open("w", encoding="utf-8") as artifact_file:
-            result = run(cmd)
-            artifact_file.write(result.stdout)
+    return (item.get("title") or "").strip().startswith(ALL_TODO_PREFIXES)
+
+
+def search_cache_path(slug: str, org: str, search: str, today_str: str) -> Path:
+    # Key on everything that shapes the response (qualifiers, limit, selected
+    # fields) so editing any of them never reuses results of the old shape.
+    key = f"{search}\n{SEARCH_LIMIT}\n{SEARCH_NODE_FIELDS}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+    return CACHE_ROOT / today_str / f"{slug}-{org}-{digest}.json"
+
+
+def load_cached_search(
+    cache_paths: dict[str, Path],
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Return cached search nodes by alias, or None unless every entry is fresh."""
+    nodes_by_alias: dict[str, list[dict[str, Any]]] = {}
+    now = time.time()
+    for alias, path in cache_paths.items():
         try:
-            data = json.loads(result.stdout)
-        except json.JSONDecodeError as exc:
-            raise SummarizeError(
-                f"Failed to parse JSON from query `{query.slug}` for org `{org}`. See {artifact_path}."
-            ) from exc
-        if not isinstance(data, list):
+            if now - path.stat().st_mtime > SEARCH_CACHE_TTL_SECONDS:
+                return None
+            nodes = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(nodes, list):
+            return None
+        nodes_by_alias[alias] = nodes
+    return nodes_by_alias
+
+
+def store_cached_search(
+    cache_paths: dict[str, Path],
+    nodes_by_alias: dict[str, list[dict[str, Any]]],
+    today_str: str,
+) -> None:
+    """Write search nodes into today's cache directory and prune older days.
+
+    Caching is best-effort: filesystem errors skip the cache rather than failing
+    a run whose GitHub search already succeeded.
+    """
+    try:
+        CACHE_ROOT.mkdir(mode=0o700, parents=True, exist_ok=True)
+        day_dir = CACHE_ROOT / today_str
+        day_dir.mkdir(mode=0o700, exist_ok=True)
+        for alias, path in cache_paths.items():
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(nodes_by_alias[alias]), encoding="utf-8")
+            os.replace(tmp_path, path)
+        for sibling in CACHE_ROOT.iterdir():
+            if sibling.is_dir() and sibling.name != today_str:
+                shutil.rmtree(sibling, ignore_errors=True)
+    except OSError:
+        return
+
+
+def fetch_search_nodes(
+    document: str,
+    variables: dict[str, str],
+    aliases: dict[str, tuple[Query, str]],
+) -> dict[str, list[dict[str, Any]]]:
+    cmd = ["gh", "api", "graphql", "-f", f"query={document}"]
+    for name, value in variables.items():
+        cmd.extend(["-f", f"{name}={value}"])
+    payload = run_json(cmd, artifact_prefix="search", label="gh api graphql (search)")
+    # GraphQL failures usually arrive as {"data": null, "errors": [...]}, so
+    # surface GitHub's own messages before validating the data shape.
+    if isinstance(payload, dict) and payload.get("errors"):
+        messages = "; ".join(
+            str(error.get("message", error)) if isinstance(error, dict) else str(error)
+            for error in payload["errors"]
+        )
+        raise SummarizeError(f"GitHub search request returned errors: {messages}")
+    if not isinstance(payload, dict) or not isinstance(payload.get("data"), dict):
+        artifact_path = write_artifact("search", json.dumps(payload, indent=2).encode())
+        raise SummarizeError(
+            f"Unexpected JSON structure from the GitHub search request. See {artifact_path}."
+        )
+    nodes_by_alias: dict[str, list[dict[str, Any]]] = {}
+    for alias, (query, org) in aliases.items():
+        connection = payload["data"].get(alias) or {}
+        nodes = connection.get("nodes")
+        if not isinstance(nodes, list):
+            artifact_path = write_artifact(
+                "search", json.dumps(payload, indent=2).encode()
+            )
             raise SummarizeError(
                 f"Unexpected JSON structure from query `{query.slug}` for org `{org}`: "
-                f"{type(data).__name__}"
+                f"{type(nodes).__name__}. See {artifact_path}."
             )
-        for item in data:
+        nodes_by_alias[alias] = nodes
+    return nodes_by_alias
+
+
+def run_queries(
+    queries: Sequence[Query],
+    today_str: str,
+    *,
+    use_cache: bool = True,
+) -> dict[str, dict[str, list[dict[str, Any]]]]:
+    """Run every query for every organization in one GraphQL request.
+
+    Results are cached for up to an hour within the America/New_York day; pass
+    ``use_cache=False`` to bypass the cache and refresh it. Returns the matching
+    items keyed by query slug and then by organization.
+    """
+    document, variables, aliases = build_search_document(queries)
+    cache_paths = {
+        alias: search_cache_path(query.slug, org, variables[alias], today_str)
+        for alias, (query, org) in aliases.items()
+    }
+    nodes_by_alias = load_cached_search(cache_paths) if use_cache else None
+    if nodes_by_alias is None:
+        nodes_by_alias = fetch_search_nodes(document, variables, aliases)
+        store_cached_search(cache_paths, nodes_by_alias, today_str)
+    aggregated: dict[str, dict[str, list[dict[str, Any]]]] = {
+        query.slug: {org: [] for org in ORG_NAMES} for query in queries
+    }
+    seen_urls: dict[str, set[str]] = {query.slug: set() for query in queries}
+    for alias, (query, org) in aliases.items():
+        for item in nodes_by_alias[alias]:
+            if not item:
+                continue
             if item.get("isDraft"):
                 continue
             if is_automation_issue(item):
                 continue
-            url = item.get("url")
-            if not url:
+            canonical_url = canonicalize_url(item.get("url"))
+            if not canonical_url:
                 continue
-            if url in seen_urls:
+            if canonical_url in seen_urls[query.slug]:
                 continue
-            seen_urls.add(url)
+            seen_urls[query.slug].add(canonical_url)
             item_copy = dict(item)
-            aggregated.setdefault(org, []).append(item_copy)
+            item_copy["_canonical_url"] = canonical_url
+            aggregated[query.slug][org].append(item_copy)
     return aggregated
 
 
-CHECKBOX_PATTERN = re.compile(r"^\s*[-*]\s*\[\s*([xX ])\s*\]\s*(.+)$")
+# Checkbox markers and repository references are pure ASCII. The checkbox
+# pattern allows only horizontal whitespace so multiline scans stay on a single
+# line. The URL patterns stay Unicode-aware so any whitespace, e.g. a
+# non-breaking space, ends a URL.
+CHECKBOX_PATTERN = re.compile(
+    r"^[ \t]*[-*][ \t]*\[[ \t]*([xX ])[ \t]*\][ \t]*(.+)$", re.ASCII | re.MULTILINE
+)
 ITEM_URL_PATTERN = re.compile(r"https://github\.com/(?P<owner>[^/\s]+)/(?P<repo>[^/\s]+)/")
 GITHUB_URL_PATTERN = re.compile(r"https://github\.com/[^\s)]+")
-REPO_REF_PATTERN = re.compile(r"([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+#[0-9]+)")
+REPO_REF_PATTERN = re.compile(r"([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+#[0-9]+)", re.ASCII)
+_ITEM_URL_SEARCH = ITEM_URL_PATTERN.search
+_GITHUB_URL_SEARCH = GITHUB_URL_PATTERN.search
+_REPO_REF_SEARCH = REPO_REF_PATTERN.search
 
 
 def repo_slug_from_item(item: dict[str, Any]) -> str:
@@ -297,7 +447,7 @@ def repo_slug_from_item(item: dict[str, Any]) -> str:
         if isinstance(owner_login, str) and owner_login and isinstance(name, str) and name:
             return f"{owner_login}/{name}"
     url = item.get("url") or ""
-    match = ITEM_URL_PATTERN.search(url)
+    match = _ITEM_URL_SEARCH(url)
     if match:
         return f"{match.group('owner')}/{match.group('repo')}"
     return "unknown"
@@ -317,94 +467,85 @@ def canonicalize_reference(url: str | None, repository: str, number: Any) -> str
 
 
 def canonicalize_line(line: str) -> str:
-    match = GITHUB_URL_PATTERN.search(line)
+    match = _GITHUB_URL_SEARCH(line) if "https://github.com/" in line else None
     if match:
         return canonicalize_url(match.group(0))
-    repo_match = REPO_REF_PATTERN.search(line)
+    repo_match = _REPO_REF_SEARCH(line)
     if repo_match:
         return repo_match.group(1).lower()
     return " ".join(line.split()).lower()
 
 
-def extract_unfinished_items(issue_body: str | None) -> list[str]:
+def extract_unfinished_items(issue_body: str | None) -> list[tuple[str, str]]:
+    """Return unchecked items as ``(canonical, text)`` pairs."""
     if not issue_body:
         return []
-    carryover: list[str] = []
-    for line in issue_body.splitlines():
-        match = CHECKBOX_PATTERN.match(line)
-        if not match:
-            continue
+    carryover: list[tuple[str, str]] = []
+    for match in CHECKBOX_PATTERN.finditer(issue_body):
         marker, text = match.groups()
         if marker.lower() != "x":
-            carryover.append(text.strip())
+            text = text.strip()
+            carryover.append((canonicalize_line(text), text))
     return carryover
 
 
 def compose_checklist_body(
     today_str: str,
     now_utc: datetime,
-    carryover: list[str],
+    carryover: list[tuple[str, str]],
     sections_by_org: dict[str, list[tuple[Query, list[tuple[str, str]]]]],
 ) -> str:
-    lines: list[str] = []
-    lines.append(f"# Todos — {today_str}")
-    lines.append("")
-    lines.append(
-        f"_Generated {now_utc.strftime('%Y-%m-%d %H:%M')} UTC via `./summarize`._"
+    buffer = io.StringIO()
+    write = buffer.write
+    write(
+        f"# Todos — {today_str}\n\n"
+        f"_Generated {now_utc:%Y-%m-%d %H:%M} UTC via `./summarize`._\n\n"
     )
-    lines.append("")
-    seen_items: set[str] = set()
-    deduped_carryover: list[str] = []
-    for item in carryover:
-        canonical = canonicalize_line(item)
-        if canonical in seen_items:
-            continue
-        seen_items.add(canonical)
-        deduped_carryover.append(item)
+    carryover_by_canonical: dict[str, str] = {}
+    for canonical, item in carryover:
+        carryover_by_canonical.setdefault(canonical, item)
+    deduped_carryover = list(carryover_by_canonical.values())
+    seen_items = set(carryover_by_canonical)
     if deduped_carryover:
-        lines.append("## Carryover from Previous List")
-        for item in deduped_carryover:
-            lines.append(f"- [ ] {item}")
-        lines.append("")
+        write("## Carryover from Previous List\n")
+        buffer.writelines(f"- [ ] {item}\n" for item in deduped_carryover)
+        write("\n")
     ordered_orgs = list(dict.fromkeys([*ORG_NAMES, *sections_by_org.keys()]))
     for org in ordered_orgs:
         org_sections = sections_by_org.get(org, [])
-        lines.append(f"## {org} Todos")
-        lines.append("")
+        write(f"## {org} Todos\n\n")
         if not org_sections:
-            lines.append("- [ ] Confirm no actionable items today.")
-            lines.append("")
+            write("- [ ] Confirm no actionable items today.\n\n")
             continue
         for query, entries in org_sections:
             filtered_lines: list[str] = []
-            for entry in entries:
-                canonical, line = entry
-                canonical_id = canonical or canonicalize_line(line)
-                if canonical_id in seen_items:
+            for canonical, line in entries:
+                if canonical in seen_items:
                     continue
-                seen_items.add(canonical_id)
+                seen_items.add(canonical)
                 filtered_lines.append(line)
-            lines.append(f"### {query.heading}")
+            write(f"### {query.heading}\n")
             if filtered_lines:
-                for line in filtered_lines:
-                    lines.append(f"- [ ] {line}")
+                buffer.writelines(f"- [ ] {line}\n" for line in filtered_lines)
             else:
-                lines.append(f"- [ ] {query.empty_message}")
-            lines.append("")
-    return "\n".join(lines).rstrip() + "\n"
+                write(f"- [ ] {query.empty_message}\n")
+            write("\n")
+    return buffer.getvalue().rstrip() + "\n"
 
 
-def collect_sections_by_org() -> dict[str, list[tuple[Query, list[tuple[str, str]]]]]:
+def collect_sections_by_org(
+    today_str: str, *, use_cache: bool = True
+) -> dict[str, list[tuple[Query, list[tuple[str, str]]]]]:
     sections: dict[str, list[tuple[Query, list[tuple[str, str]]]]] = {
         org: [] for org in ORG_NAMES
     }
-    for query in build_queries():
-        try:
-            items_by_org = run_query(query)
-        except SummarizeError as exc:
-            raise SummarizeError(
-                f"Unable to complete query '{query.slug}'. {exc}"
-            ) from exc
+    queries = build_queries()
+    try:
+        items_by_query = run_queries(queries, today_str, use_cache=use_cache)
+    except SummarizeError as exc:
+        raise SummarizeError(f"Unable to complete GitHub search. {exc}") from exc
+    for query in queries:
+        items_by_org = items_by_query.get(query.slug, {})
         for org in ORG_NAMES:
             org_items = items_by_org.get(org, [])
             sorted_items = sorted(
@@ -419,7 +560,7 @@ def collect_sections_by_org() -> dict[str, list[tuple[Query, list[tuple[str, str
     return sections
 
 
-CHECKLIST_FILENAME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}\.md$")
+CHECKLIST_FILENAME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}\.md$", re.ASCII)
 
 
 def ensure_tasks_dir() -> Path:
@@ -427,33 +568,54 @@ def ensure_tasks_dir() -> Path:
     return TASKS_DIR
 
 
-def list_checklist_files() -> list[Path]:
+def iter_checklist_files() -> Iterator[Path]:
     if not TASKS_DIR.exists():
-        return []
-    files = [
-        path
-        for path in TASKS_DIR.iterdir()
-        if path.is_file() and CHECKLIST_FILENAME_PATTERN.match(path.name)
-    ]
-    return sorted(files)
+        return
+    # DirEntry.is_file() reuses the readdir file type instead of a stat per entry.
+    with os.scandir(TASKS_DIR) as entries:
+        for entry in entries:
+            if CHECKLIST_FILENAME_PATTERN.match(entry.name) and entry.is_file():
+                yield Path(entry.path)
 
 
 def find_previous_checklist(today_filename: str) -> Path | None:
-    for path in reversed(list_checklist_files()):
-        if path.name < today_filename:
-            return path
-    return None
+    # Date-stamped names sort chronologically, so track the max in one pass.
+    previous: Path | None = None
+    for path in iter_checklist_files():
+        name = path.name
+        if name < today_filename and (previous is None or name > previous.name):
+            previous = path
+    return previous
 
 
 def find_latest_checklist() -> Path | None:
-    files = list_checklist_files()
-    return files[-1] if files else None
+    return max(iter_checklist_files(), key=operator.attrgetter("name"), default=None)
+
+
+def read_checklist(path: Path) -> str:
+    """Read a checklist with raw reads, bypassing the buffered text layers.
+
+    Newlines are normalised to match ``Path.read_text``.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunk_size = max(os.fstat(fd).st_size, 1 << 16)
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def show_checklist(path: Path) -> None:
     print(f"{path.name} — {path.resolve()}")
     print("")
-    print(path.read_text(encoding="utf-8"))
+    print(read_checklist(path))
 
 
 def parse_args() -> argparse.Namespace:
@@ -480,13 +642,8 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
-    try:
-        timezone = ZoneInfo("America/New_York")
-    except Exception as exc:
-        raise SummarizeError("Unable to load America/New_York timezone.") from exc
-
-    now_utc = datetime.now(tz=ZoneInfo("UTC"))
-    now_ny = now_utc.astimezone(timezone)
+    now_utc = datetime.now(tz=UTC_TZ)
+    now_ny = now_utc.astimezone(NY_TZ)
     today_str = now_ny.date().isoformat()
     today_filename = f"{today_str}.md"
     today_path = TASKS_DIR / today_filename
@@ -504,27 +661,21 @@ def main() -> int:
         return 0
 
     if existing_today and not args.force:
-        print(
-            textwrap.dedent(
-                """
-                Today's checklist already exists (found local Markdown file for the current America/New_York day).
-                Showing the current file instead of regenerating.
-                """
-            ).strip()
-        )
+        print(ALREADY_EXISTS_MESSAGE)
         show_checklist(today_path)
         return 0
 
+    previous_path: Path | None = None
     if args.force and existing_today:
-        carryover_source = today_path.read_text(encoding="utf-8")
+        carryover_source = read_checklist(today_path)
     else:
         previous_path = find_previous_checklist(today_filename)
         carryover_source = (
-            previous_path.read_text(encoding="utf-8") if previous_path else None
+            read_checklist(previous_path) if previous_path else None
         )
     carryover = extract_unfinished_items(carryover_source)
 
-    sections_by_org = collect_sections_by_org()
+    sections_by_org = collect_sections_by_org(today_str, use_cache=not args.force)
     body = compose_checklist_body(today_str, now_utc, carryover, sections_by_org)
 
     if args.dry_run:
@@ -540,7 +691,7 @@ def main() -> int:
         return 0
 
     today_path.write_text(body, encoding="utf-8")
-    if find_previous_checklist(today_filename):
+    if previous_path:
         print(f"Checklist written to {today_path} (carryover items preserved).")
     else:
         print(f"Checklist written to {today_path}.")